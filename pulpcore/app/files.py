@@ -8,11 +8,18 @@ from django.core.files.uploadhandler import TemporaryFileUploadHandler
 class PulpTemporaryUploadedFile(TemporaryUploadedFile):
     """
     A file uploaded to a temporary location in Pulp.
+
+    Attributes:
+        hashers (dict): A hashlib object for each of the ``Artifact.DIGEST_FIELDS``, keyed by
+            algorithm name.
     """
 
     def __init__(self, name, content_type, size, charset, content_type_extra=None):
+        # Imported here to avoid a circular import with pulpcore.app.models.fields
+        from pulpcore.app.models import Artifact
+
         self.hashers = {}
-        for hasher in hashlib.algorithms_guaranteed:
+        for hasher in Artifact.DIGEST_FIELDS:
             self.hashers[hasher] = getattr(hashlib, hasher)()
         super().__init__(name, content_type, size, charset, content_type_extra)
 
@@ -30,9 +37,9 @@ class PulpTemporaryUploadedFile(TemporaryUploadedFile):
         name = os.path.basename(file.name)
         instance = cls(name, '', file.size, '', '')
         instance.file = file
-        data = file.read()
-        for hasher in hashlib.algorithms_guaranteed:
-            instance.hashers[hasher].update(data)
+        for chunk in file.chunks(chunk_size=1048576):  # 1 megabyte
+            for hasher in instance.hashers.values():
+                hasher.update(chunk)
         return instance
 
 
@@ -62,8 +69,8 @@ class HashingFileUploadHandler(TemporaryFileUploadHandler):
 
     def receive_data_chunk(self, raw_data, start):
         self.file.write(raw_data)
-        for hasher in hashlib.algorithms_guaranteed:
-            self.file.hashers[hasher].update(raw_data)
+        for hasher in self.file.hashers.values():
+            hasher.update(raw_data)
 
 
 class TemporaryDownloadedFile(TemporaryUploadedFile):
@@ -2,6 +2,10 @@
 Content related Django models.
 """
 import hashlib
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from gettext import gettext as _
 from itertools import chain
 
 from django.core import validators
@@ -12,6 +16,10 @@ from pulpcore.app.models import MasterModel, Model, fields, storage
 from pulpcore.exceptions import DigestValidationError, SizeValidationError
 
 
+# Files at least this large are hashed through a memory map instead of chunked reads.
+MMAP_HASHING_THRESHOLD = 10 * 1024 * 1024  # 10 megabytes
+
+
 class BulkCreateManager(models.Manager):
     """
     A manager that provides a bulk_get_or_create()
@@ -191,11 +199,14 @@ class Artifact(Model):
             file (:class:`~pulpcore.app.files.PulpTemporaryUploadedFile` or str): The
                 PulpTemporaryUploadedFile to create the Artifact from or a string with the full path
                 to the file on disk.
-            expected_digests (dict): Keyed on the algorithm name provided by hashlib and stores the
-                value of the expected digest. e.g. {'md5': '912ec803b2ce49e4a541068d495ab570'}
+            expected_digests (dict): Keyed on an algorithm name from ``Artifact.DIGEST_FIELDS``
+                and stores the value of the expected digest.
+                e.g. {'md5': '912ec803b2ce49e4a541068d495ab570'}
             expected_size (int): The number of bytes the download is expected to have.
 
         Raises:
+            ValueError: When ``expected_digests`` names an algorithm that is not one of
+                ``Artifact.DIGEST_FIELDS``
             :class:`~pulpcore.exceptions.DigestValidationError`: When any of the ``expected_digest``
                 values don't match the digest of the data
             :class:`~pulpcore.exceptions.SizeValidationError`: When the ``expected_size`` value
@@ -204,17 +215,43 @@ class Artifact(Model):
         Returns:
             An in-memory, unsaved :class:`~pulpcore.plugin.models.Artifact`
         """
+        if expected_digests:
+            unsupported = set(expected_digests) - set(Artifact.DIGEST_FIELDS)
+            if unsupported:
+                msg = _("Unsupported digest algorithm(s): {unsupported}. Supported algorithms "
+                        "are: {supported}.")
+                raise ValueError(msg.format(unsupported=', '.join(sorted(unsupported)),
+                                            supported=', '.join(Artifact.DIGEST_FIELDS)))
+
         if isinstance(file, str):
             with open(file, 'rb') as f:
-                hashers = {n: hashlib.new(n) for n in Artifact.DIGEST_FIELDS}
-                size = 0
-                while True:
-                    chunk = f.read(1048576)  # 1 megabyte
-                    if not chunk:
-                        break
-                    for algorithm in hashers.values():
-                        algorithm.update(chunk)
-                    size = size + len(chunk)
+                hashers = {n: getattr(hashlib, n)() for n in Artifact.DIGEST_FIELDS}
+                size = os.fstat(f.fileno()).st_size
+                if size >= MMAP_HASHING_THRESHOLD:
+                    # Let the hashers read straight from the page cache instead of copying
+                    # every chunk into a new bytes object. The caller must own the file and it
+                    # must not change while being hashed: truncating a mapped file raises
+                    # SIGBUS, which kills the process instead of failing digest validation.
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                            mapped.madvise(mmap.MADV_SEQUENTIAL)
+                        # hashlib releases the GIL while digesting large buffers, so each
+                        # algorithm can walk the mapping on its own core.
+                        with ThreadPoolExecutor(max_workers=len(hashers)) as executor:
+                            updates = [executor.submit(algorithm.update, mapped)
+                                       for algorithm in hashers.values()]
+                            for update in updates:
+                                update.result()
+                        size = len(mapped)
+                else:
+                    size = 0
+                    while True:
+                        chunk = f.read(1048576)  # 1 megabyte
+                        if not chunk:
+                            break
+                        for algorithm in hashers.values():
+                            algorithm.update(chunk)
+                        size = size + len(chunk)
         else:
             size = file.size
             hashers = file.hashers
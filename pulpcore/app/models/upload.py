@@ -31,7 +31,7 @@ class Upload(Model):
             offset (int): First byte position to write chunk to.
         """
         if not self.file:
-            self.file.save(os.path.join('upload', str(self.pk)), ContentFile(''))
+            self.file.save(os.path.join('upload', str(self.pk)), ContentFile(b''))
 
         with self.file.open(mode='r+b') as file:
             file.seek(offset)
@@ -42,10 +42,16 @@ class Upload(Model):
     @property
     def sha256(self, rehash=False):
         if getattr(self, '_sha256', None) is None or rehash is True:
-            sha256 = hashlib.sha256()
             with self.file.open(mode='rb') as file:
-                for chunk in file.chunks():
-                    sha256.update(chunk)
+                try:
+                    # Python 3.11+ runs the read/update loop in C with a single reused buffer
+                    sha256 = hashlib.file_digest(file, 'sha256')
+                except (AttributeError, ValueError):
+                    # Older Pythons lack file_digest(), and some storage backends return file
+                    # objects without the binary readinto() it requires.
+                    sha256 = hashlib.sha256()
+                    for chunk in file.chunks(chunk_size=1048576):  # 1 megabyte
+                        sha256.update(chunk)
             self._sha256 = sha256.hexdigest()
         return self._sha256
 
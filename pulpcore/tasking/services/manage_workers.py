@@ -45,16 +45,19 @@ def _get_concurrency():
 
 def _get_file_contents(path):
     """
-    Open the file at path, read() it, close the file, and return a string of its contents.
+    Open the file at path, read() it, close the file, and return its contents if it exists.
 
     Args:
         path (str): The path to the file
 
     Returns:
-        str: The file's contents
+        str: The file's contents, or None if the file does not exist
     """
-    with open(path) as f:
-        return f.read()
+    try:
+        with open(path) as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
 
 
 def _start_workers():
@@ -67,7 +70,7 @@ def _start_workers():
         unit_filename = _UNIT_FILENAME_TEMPLATE % i
         unit_path = os.path.join(_SYSTEMD_UNIT_PATH, unit_filename)
         unit_contents = _WORKER_TEMPLATE % {'num': i, 'environment_file': _ENVIRONMENT_FILE}
-        if not os.path.exists(unit_path) or _get_file_contents(unit_path) != unit_contents:
+        if _get_file_contents(unit_path) != unit_contents:
             with open(unit_path, 'w') as unit_file:
                 unit_file.write(unit_contents)
         # Start the worker
@@ -1,7 +1,5 @@
 # coding=utf-8
 """Constants for pulpcore API tests that require the use of a plugin."""
-from urllib.parse import urljoin
-
 from pulp_smash.constants import PULP_FIXTURES_BASE_URL
 from pulp_smash.pulp3.constants import (
     BASE_DISTRIBUTION_PATH,
@@ -10,30 +8,41 @@ from pulp_smash.pulp3.constants import (
     CONTENT_PATH,
 )
 
+# The constants below are built by plain concatenation, which relies on every base ending in '/'.
+for _base in (
+    BASE_DISTRIBUTION_PATH,
+    BASE_PUBLICATION_PATH,
+    BASE_REMOTE_PATH,
+    CONTENT_PATH,
+    PULP_FIXTURES_BASE_URL,
+):
+    assert _base.endswith('/'), _base
+del _base
+
 FILE_CONTENT_NAME = 'file.file'
 
-FILE_CONTENT_PATH = urljoin(CONTENT_PATH, 'file/files/')
+FILE_CONTENT_PATH = CONTENT_PATH + 'file/files/'
 
-FILE_REMOTE_PATH = urljoin(BASE_REMOTE_PATH, 'file/file/')
+FILE_REMOTE_PATH = BASE_REMOTE_PATH + 'file/file/'
 
-FILE_DISTRIBUTION_PATH = urljoin(BASE_DISTRIBUTION_PATH, 'file/file/')
+FILE_DISTRIBUTION_PATH = BASE_DISTRIBUTION_PATH + 'file/file/'
 
-FILE_PUBLICATION_PATH = urljoin(BASE_PUBLICATION_PATH, 'file/file/')
+FILE_PUBLICATION_PATH = BASE_PUBLICATION_PATH + 'file/file/'
 
-FILE_CHUNKED_FIXTURE_URL = urljoin(PULP_FIXTURES_BASE_URL, 'file-chunked/')
+FILE_CHUNKED_FIXTURE_URL = PULP_FIXTURES_BASE_URL + 'file-chunked/'
 
-FILE_TO_BE_CHUNKED_URL = urljoin(FILE_CHUNKED_FIXTURE_URL, '1.iso')
+FILE_TO_BE_CHUNKED_URL = FILE_CHUNKED_FIXTURE_URL + '1.iso'
 
-FILE_CHUNKED_MANIFEST_URL = urljoin(FILE_CHUNKED_FIXTURE_URL, 'PULP_MANIFEST')
+FILE_CHUNKED_MANIFEST_URL = FILE_CHUNKED_FIXTURE_URL + 'PULP_MANIFEST'
 
-FILE_CHUNKED_PART_1_URL = urljoin(FILE_CHUNKED_FIXTURE_URL, 'chunkaa')
+FILE_CHUNKED_PART_1_URL = FILE_CHUNKED_FIXTURE_URL + 'chunkaa'
 
-FILE_CHUNKED_PART_2_URL = urljoin(FILE_CHUNKED_FIXTURE_URL, 'chunkab')
+FILE_CHUNKED_PART_2_URL = FILE_CHUNKED_FIXTURE_URL + 'chunkab'
 
-FILE_FIXTURE_URL = urljoin(PULP_FIXTURES_BASE_URL, 'file/')
+FILE_FIXTURE_URL = PULP_FIXTURES_BASE_URL + 'file/'
 """The URL to a file repository."""
 
-FILE_FIXTURE_MANIFEST_URL = urljoin(FILE_FIXTURE_URL, 'PULP_MANIFEST')
+FILE_FIXTURE_MANIFEST_URL = FILE_FIXTURE_URL + 'PULP_MANIFEST'
 """The URL to a file repository manifest."""
 
 FILE_FIXTURE_COUNT = 3
@@ -42,50 +51,46 @@ FILE_FIXTURE_COUNT = 3
 FILE_FIXTURE_SUMMARY = {FILE_CONTENT_NAME: FILE_FIXTURE_COUNT}
 """The desired content summary after syncing :data:`FILE_FIXTURE_URL`."""
 
-FILE2_FIXTURE_URL = urljoin(PULP_FIXTURES_BASE_URL, 'file2/')
+FILE2_FIXTURE_URL = PULP_FIXTURES_BASE_URL + 'file2/'
 """The URL to a file repository."""
 
-FILE2_FIXTURE_MANIFEST_URL = urljoin(FILE2_FIXTURE_URL, 'PULP_MANIFEST')
+FILE2_FIXTURE_MANIFEST_URL = FILE2_FIXTURE_URL + 'PULP_MANIFEST'
 """The URL to a file repository manifest"""
 
-FILE_MANY_FIXTURE_URL = urljoin(PULP_FIXTURES_BASE_URL, 'file-many/')
+FILE_MANY_FIXTURE_URL = PULP_FIXTURES_BASE_URL + 'file-many/'
 """The URL to a file repository containing many files."""
 
-FILE_MANY_FIXTURE_MANIFEST_URL = urljoin(
-    FILE_MANY_FIXTURE_URL, 'PULP_MANIFEST'
-)
+FILE_MANY_FIXTURE_MANIFEST_URL = FILE_MANY_FIXTURE_URL + 'PULP_MANIFEST'
 """The URL to a file repository manifest"""
 
 FILE_MANY_FIXTURE_COUNT = 250
 """The number of packages available at :data:`FILE_MANY_FIXTURE_URL`."""
 
-FILE_LARGE_FIXTURE_URL = urljoin(PULP_FIXTURES_BASE_URL, 'file-large/')
+FILE_LARGE_FIXTURE_URL = PULP_FIXTURES_BASE_URL + 'file-large/'
 """The URL to a file repository containing a large number of files."""
 
-FILE_LARGE_URL = urljoin(FILE_LARGE_FIXTURE_URL, '1.iso')
+FILE_LARGE_URL = FILE_LARGE_FIXTURE_URL + '1.iso'
 """The URL to a large ISO file at :data:`FILE_LARGE_FIXTURE_URL`."""
 
 FILE_LARGE_FIXTURE_COUNT = 10
 """The number of packages available at :data:`FILE_LARGE_FIXTURE_URL`."""
 
-FILE_LARGE_FIXTURE_MANIFEST_URL = urljoin(
-    FILE_LARGE_FIXTURE_URL, 'PULP_MANIFEST'
-)
+FILE_LARGE_FIXTURE_MANIFEST_URL = FILE_LARGE_FIXTURE_URL + 'PULP_MANIFEST'
 """The URL to a file repository manifest."""
 
-FILE_URL = urljoin(FILE_FIXTURE_URL, '1.iso')
+FILE_URL = FILE_FIXTURE_URL + '1.iso'
 """The URL to an ISO file at :data:`FILE_FIXTURE_URL`."""
 
-FILE2_URL = urljoin(FILE2_FIXTURE_URL, '1.iso')
+FILE2_URL = FILE2_FIXTURE_URL + '1.iso'
 """The URL to an ISO file at :data:`FILE2_FIXTURE_URL`."""
 
 RPM_PACKAGE_CONTENT_NAME = 'rpm.package'
 
 RPM_ADVISORY_CONTENT_NAME = 'rpm.advisory'
 
-RPM_REMOTE_PATH = urljoin(BASE_REMOTE_PATH, 'rpm/rpm/')
+RPM_REMOTE_PATH = BASE_REMOTE_PATH + 'rpm/rpm/'
 
-RPM_UNSIGNED_FIXTURE_URL = urljoin(PULP_FIXTURES_BASE_URL, 'rpm-unsigned/')
+RPM_UNSIGNED_FIXTURE_URL = PULP_FIXTURES_BASE_URL + 'rpm-unsigned/'
 """The URL to a repository with unsigned RPM packages."""
 
 RPM_PACKAGE_COUNT = 35
@@ -0,0 +1,84 @@
+import hashlib
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from pulpcore.app.models import Artifact, content
+from pulpcore.exceptions import DigestValidationError
+
+
+class ArtifactInitAndValidateTestCase(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_file(self, data):
+        path = os.path.join(self.tmp_dir.name, 'file')
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def assertArtifactMatches(self, artifact, data):
+        self.assertEqual(artifact.size, len(data))
+        for algorithm in Artifact.DIGEST_FIELDS:
+            self.assertEqual(getattr(artifact, algorithm), hashlib.new(algorithm, data).hexdigest())
+
+    def test_empty_file(self):
+        """An empty file has a size of zero and the digests of no data."""
+        artifact = Artifact.init_and_validate(self.write_file(b''))
+        self.assertArtifactMatches(artifact, b'')
+
+    def test_below_mmap_threshold(self):
+        """Files below the threshold are hashed in chunks, including the partial last chunk."""
+        data = os.urandom(1048576 + 1024)
+        self.assertLess(len(data), content.MMAP_HASHING_THRESHOLD)
+        artifact = Artifact.init_and_validate(self.write_file(data))
+        self.assertArtifactMatches(artifact, data)
+
+    def test_mmap_threshold(self):
+        """Files at or above the threshold are hashed through a memory map."""
+        data = os.urandom(4096)
+        path = self.write_file(data)
+        for threshold in (len(data), len(data) - 1):
+            with mock.patch.object(content, 'MMAP_HASHING_THRESHOLD', threshold), \
+                    mock.patch.object(content.mmap, 'mmap', wraps=content.mmap.mmap) as mmap:
+                artifact = Artifact.init_and_validate(path)
+            mmap.assert_called_once()
+            self.assertArtifactMatches(artifact, data)
+
+    def test_mmap_and_chunked_agree(self):
+        """Both sides of the threshold produce the same size and digests for the same file."""
+        path = self.write_file(os.urandom(4096))
+        chunked = Artifact.init_and_validate(path)
+        with mock.patch.object(content, 'MMAP_HASHING_THRESHOLD', 1):
+            mapped = Artifact.init_and_validate(path)
+        for field in ('size',) + Artifact.DIGEST_FIELDS:
+            self.assertEqual(getattr(chunked, field), getattr(mapped, field))
+
+    def test_digest_mismatch(self):
+        """A wrong expected digest raises DigestValidationError on both sides of the threshold."""
+        data = os.urandom(4096)
+        path = self.write_file(data)
+        expected_digests = {'sha256': hashlib.sha256(data).hexdigest(), 'md5': '0' * 32}
+        for threshold in (content.MMAP_HASHING_THRESHOLD, 1):
+            with mock.patch.object(content, 'MMAP_HASHING_THRESHOLD', threshold):
+                with self.assertRaises(DigestValidationError):
+                    Artifact.init_and_validate(path, expected_digests=expected_digests)
+
+    def test_mmap_hasher_error(self):
+        """An error raised while hashing a memory map propagates to the caller."""
+        path = self.write_file(os.urandom(4096))
+        hasher = mock.Mock(**{'update.side_effect': MemoryError})
+        with mock.patch.object(content, 'MMAP_HASHING_THRESHOLD', 1), \
+                mock.patch.object(content.hashlib, 'md5', return_value=hasher):
+            with self.assertRaises(MemoryError):
+                Artifact.init_and_validate(path)
+
+    def test_unsupported_digest(self):
+        """An expected digest for an algorithm an Artifact doesn't store raises ValueError."""
+        path = self.write_file(b'pulp')
+        with self.assertRaisesRegex(ValueError, 'sha3_256'):
+            Artifact.init_and_validate(path, expected_digests={'sha3_256': '0' * 64})
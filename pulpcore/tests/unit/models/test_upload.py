@@ -0,0 +1,30 @@
+import hashlib
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+
+from pulpcore.app.models import Upload
+
+
+class UploadTestCase(TestCase):
+
+    def setUp(self):
+        self.data = b'pulp' * 300000
+        self.upload = Upload.objects.create(size=len(self.data))
+        self.upload.append(SimpleUploadedFile('chunk', self.data), 0)
+
+    def tearDown(self):
+        self.upload.delete()
+
+    def test_sha256(self):
+        """The sha256 of an upload matches the digest of its data."""
+        self.assertEqual(self.upload.sha256, hashlib.sha256(self.data).hexdigest())
+
+    def test_sha256_file_digest_unsupported(self):
+        """
+        Falls back to chunked hashing when the storage file object can't be used by
+        hashlib.file_digest().
+        """
+        with mock.patch.object(hashlib, 'file_digest', side_effect=ValueError, create=True):
+            self.assertEqual(self.upload.sha256, hashlib.sha256(self.data).hexdigest())
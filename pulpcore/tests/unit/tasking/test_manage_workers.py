@@ -0,0 +1,25 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from pulpcore.tasking.services import manage_workers
+
+
+class TestGetFileContents(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'pulp-worker-0.service')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_existing_file(self):
+        """The contents of an existing file are returned."""
+        with open(self.path, 'w') as f:
+            f.write('[Unit]\n')
+        self.assertEqual(manage_workers._get_file_contents(self.path), '[Unit]\n')
+
+    def test_missing_file(self):
+        """A missing file returns None."""
+        self.assertIsNone(manage_workers._get_file_contents(self.path))
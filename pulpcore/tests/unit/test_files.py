@@ -0,0 +1,45 @@
+import hashlib
+import os
+import tempfile
+from unittest import TestCase
+
+from django.core.files import File
+
+from pulpcore.app.files import PulpTemporaryUploadedFile
+from pulpcore.app.models import Artifact
+
+
+class TestPulpTemporaryUploadedFile(TestCase):
+
+    def setUp(self):
+        self.tmp_file = tempfile.NamedTemporaryFile()
+
+    def tearDown(self):
+        self.tmp_file.close()
+
+    def from_data(self, data, offset=0):
+        self.tmp_file.write(data)
+        self.tmp_file.flush()
+        file = File(open(self.tmp_file.name, 'rb'))
+        file.seek(offset)
+        return PulpTemporaryUploadedFile.from_file(file)
+
+    def test_hashers(self):
+        """Only the digests an Artifact stores are computed."""
+        data = b'pulp'
+        uploaded_file = self.from_data(data)
+        self.assertEqual(set(uploaded_file.hashers), set(Artifact.DIGEST_FIELDS))
+        for algorithm, hasher in uploaded_file.hashers.items():
+            self.assertEqual(hasher.hexdigest(), hashlib.new(algorithm, data).hexdigest())
+        uploaded_file.file.close()
+
+    def test_from_file_multiple_chunks(self):
+        """
+        A file spanning several chunks hashes the same as its whole contents, regardless of the
+        file's current position.
+        """
+        data = os.urandom(2 * 1048576 + 1024)
+        uploaded_file = self.from_data(data, offset=1024)
+        for algorithm, hasher in uploaded_file.hashers.items():
+            self.assertEqual(hasher.hexdigest(), hashlib.new(algorithm, data).hexdigest())
+        uploaded_file.file.close()